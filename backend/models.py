@@ -2,6 +2,8 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+import hashlib
+import json
 
 db = SQLAlchemy()
 
@@ -60,3 +62,59 @@ class Team(db.Model):
     material_filename = db.Column(db.String(200), nullable=True)
 
     pairs = db.relationship('Pair', backref='team', lazy=True)
+
+
+class TeamSnapshot(db.Model):
+    """Denormalized copy of everything student_view_team.html renders for a team."""
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+    payload = db.Column(db.Text, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def data(self):
+        return json.loads(self.payload)
+
+    @property
+    def etag(self):
+        # Payload is hashed in so a recycled team id never matches an old tag
+        digest = hashlib.sha1(self.payload.encode('utf-8')).hexdigest()[:16]
+        return f'team-{self.team_id}-v{self.version}-{digest}'
+
+
+def refresh_team_snapshot(team):
+    """Rebuild the snapshot for `team` and bump its version. Caller commits."""
+    members = User.query.join(Pair, User.pair_id == Pair.id)\
+        .filter(Pair.team_id == team.id)\
+        .order_by(Pair.id, User.id)\
+        .all()
+
+    pairs = {}
+    for student in members:
+        pairs.setdefault(student.pair_id, []).append({
+            'id': student.id,
+            'name': student.name,
+            'dept': student.dept,
+            'section': student.section,
+            'sigbed_team': student.sigbed_team,
+        })
+
+    payload = json.dumps({
+        'id': team.id,
+        'team_name': team.team_name,
+        'school_name': team.school_name,
+        'outreach_date': team.outreach_date,
+        'time_interval': team.time_interval,
+        'topic': team.topic,
+        'material_filename': team.material_filename,
+        'pairs': [{'id': pair_id, 'students': students} for pair_id, students in pairs.items()],
+    })
+
+    snapshot = TeamSnapshot.query.get(team.id)
+    if snapshot is None:
+        snapshot = TeamSnapshot(team_id=team.id, version=1, payload=payload)
+        db.session.add(snapshot)
+    else:
+        snapshot.version += 1
+        snapshot.payload = payload
+    return snapshot
@@ -6,7 +6,7 @@ from flask import send_file
 from werkzeug.utils import secure_filename
 from flask import current_app, Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
-from models import db, User, Pair, Team
+from models import db, User, Pair, Team, TeamSnapshot, refresh_team_snapshot
 
 admin = Blueprint('admin', __name__)
 
@@ -145,6 +145,7 @@ def create_team():
         for p_id in [p1_id, p2_id]:
             pair = Pair.query.get(p_id)
             if pair: pair.team_id = new_team.id
+        refresh_team_snapshot(new_team)
         db.session.commit()
         flash(f'Team {team_name} assembled!', 'success')
         return redirect(url_for('admin.view_teams'))
@@ -170,7 +171,8 @@ def disband_team(team_id):
             if os.path.exists(file_path):
                 os.remove(file_path)
         
-        # 3. Delete the team itself
+        # 3. Drop the cached student view, then delete the team itself
+        TeamSnapshot.query.filter_by(team_id=team.id).delete()
         db.session.delete(team)
         db.session.commit()
         flash(f'Team "{team.team_name}" has been disbanded. Pairs are now available for reassignment.', 'success')
@@ -190,7 +192,9 @@ def unpair_student(user_id):
         partner = User.query.filter(User.pair_id == pair.id, User.id != student.id).first()
         student.pair_id = None
         if partner: partner.pair_id = None
+        team = pair.team
         db.session.delete(pair)
+        if team: refresh_team_snapshot(team)
         db.session.commit()
         flash(f'Pairing dissolved for {student.name}.', 'success')
     return redirect(url_for('admin.view_enrollments'))
@@ -217,6 +221,7 @@ def assign_mission(team_id):
             file.save(os.path.join(upload_path, filename))
             team.material_filename = filename 
             
+        refresh_team_snapshot(team)
         db.session.commit()
         flash(f'Mission and materials updated for {team.team_name}!', 'success')
         return redirect(url_for('admin.view_teams'))
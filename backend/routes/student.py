@@ -1,6 +1,6 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, render_template, redirect, url_for, flash, request, session, make_response
 from flask_login import login_required, current_user
-from models import db, User, Pair, Team, Request
+from models import db, User, Pair, Team, Request, TeamSnapshot, refresh_team_snapshot
 
 student = Blueprint('student', __name__)
 
@@ -103,11 +103,31 @@ def accept_request(request_id):
 @student.route('/student/view-team')
 @login_required
 def view_team():
+    # Single keyed read: the pair's team snapshot, built by the admin routes
+    snapshot = None
+    if current_user.pair_id:
+        snapshot = TeamSnapshot.query.join(Pair, Pair.team_id == TeamSnapshot.team_id)\
+            .filter(Pair.id == current_user.pair_id)\
+            .first()
+
+        # Teams formed before snapshots existed get one built on first view
+        if snapshot is None and current_user.pair.team_id:
+            snapshot = refresh_team_snapshot(Team.query.get(current_user.pair.team_id))
+            db.session.commit()
+
     # Validation: Must have a pair AND that pair must be assigned to a team by admin
-    if not current_user.pair_id or not current_user.pair.team_id:
+    if snapshot is None:
         flash("Your 4-member outreach team has not been formed yet. Please wait for faculty assignment.", "info")
         return redirect(url_for('student.student_dashboard'))
 
-    # Fetch the team and pass it to the template
-    team = Team.query.get(current_user.pair.team_id)
-    return render_template('student_view_team.html', team=team)
\ No newline at end of file
+    # The page header shows the signed-in user, so the tag is per user
+    etag = f'{current_user.id}-{snapshot.etag}'
+    # Pending flash messages would be lost on a 304, so render them instead
+    if etag in request.if_none_match and '_flashes' not in session:
+        response = make_response('', 304)
+    else:
+        response = make_response(render_template('student_view_team.html', team=snapshot.data))
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response